@@ -13,6 +13,10 @@ Purpose:
       3. Key supporting libraries (numpy, pandas, mysql-connector-python)
     It then prints the required "Hello, Chatbot!" confirmation message.
 
+    A successful result is cached in ~/.cache/itec5025/env_check.json and
+    reused until the interpreter or any directory on its import path changes.
+    Delete that file to force a full re-check.
+
 How to run:
     1. Create and activate a virtual environment:
            python -m venv chatbot_env
@@ -24,8 +28,23 @@ How to run:
 """
 
 # ── Standard library imports ──────────────────────────────────────────────────
+import os           # Read NO_COLOR from the environment
 import sys          # Access Python version and interpreter info
 import platform     # Detect operating system details
+import hashlib      # Fingerprint the environment for the result cache
+import json         # Read/write the result cache
+import site         # Locate the per-user site-packages directory
+import sysconfig    # Locate the site-packages directory
+from pathlib import Path  # Cross-platform cache path handling
+
+# Distribution names TensorFlow may be installed under, checked in order
+TENSORFLOW_DISTRIBUTIONS = ("tensorflow", "tensorflow-cpu", "tensorflow-gpu")
+
+# Where a successful environment check is remembered between runs
+CACHE_FILE = Path.home() / ".cache" / "itec5025" / "env_check.json"
+
+# Platform details never change during a run, so look them up once
+_SYSTEM, _MACHINE = platform.system(), platform.machine()
 
 # ── Helper: coloured console output ──────────────────────────────────────────
 # ANSI escape codes let us print green (✓) or red (✗) status lines.
@@ -37,6 +56,10 @@ YELLOW = "\033[93m"
 CYAN   = "\033[96m"
 RESET  = "\033[0m"
 
+# Plain output when redirected to a file/CI log, or when NO_COLOR is set
+if not sys.stdout.isatty() or "NO_COLOR" in os.environ:
+    GREEN = RED = YELLOW = CYAN = RESET = ""
+
 def ok(msg: str) -> None:
     """Print a green success line."""
     print(f"  {GREEN}✓ {msg}{RESET}")
@@ -59,11 +82,11 @@ def check_python() -> bool:
     Returns:
         bool: True if the version requirement is met, False otherwise.
     """
-    major, minor = sys.version_info.major, sys.version_info.minor
-    version_str  = f"{major}.{minor}.{sys.version_info.micro}"
+    vi          = sys.version_info
+    version_str = f"{vi.major}.{vi.minor}.{vi.micro}"
 
-    if major == 3 and minor >= 8:
-        ok(f"Python {version_str}  ({platform.system()} {platform.machine()})")
+    if vi >= (3, 8):
+        ok(f"Python {version_str}  ({_SYSTEM} {_MACHINE})")
         return True
     else:
         fail(f"Python {version_str} detected — Python 3.8+ is required.")
@@ -74,25 +97,31 @@ def check_python() -> bool:
 
 def check_tensorflow() -> bool:
     """
-    Attempt to import TensorFlow and report its version.
+    Confirm TensorFlow is installed and report its version.
 
     TensorFlow is the machine-learning backbone for the chatbot's intent
     classification model (to be built in later weeks).
 
+    The version is read from the installed package metadata rather than by
+    importing tensorflow, which takes several seconds and initialises
+    CUDA/XLA just to expose ``tf.__version__``. The tensorflow namespace is
+    never touched. CPU-only and GPU builds are published under their own
+    distribution names, so each of those is tried as well.
+
     Returns:
-        bool: True if TensorFlow imported successfully, False otherwise.
+        bool: True if TensorFlow is installed, False otherwise.
     """
-    try:
-        import tensorflow as tf                          # noqa: F401
-        ok(f"TensorFlow {tf.__version__} installed")
-        return True
-    except ImportError:
-        fail("TensorFlow not found — run:  pip install tensorflow")
-        return False
-    except Exception as exc:
-        # Catch any unexpected import-time errors (e.g. DLL load failures)
-        fail(f"TensorFlow import error: {exc}")
-        return False
+    from importlib.metadata import version, PackageNotFoundError
+
+    for dist in TENSORFLOW_DISTRIBUTIONS:
+        try:
+            ok(f"TensorFlow {version(dist)} installed ({dist})")
+            return True
+        except PackageNotFoundError:
+            continue
+
+    fail("TensorFlow not found — run:  pip install tensorflow")
+    return False
 
 
 # ── Section 3: Supporting library checks ─────────────────────────────────────
@@ -141,7 +170,86 @@ def check_libraries() -> dict:
     return results
 
 
-# ── Section 4: Summary banner ─────────────────────────────────────────────────
+# ── Section 4: Environment-check cache ──────────────────────────────────────
+
+def environment_key() -> str:
+    """
+    Fingerprint the current interpreter and its installed packages.
+
+    Installing or removing a package touches the directory it lives in,
+    which changes that directory's modification time and therefore the key.
+    Every directory a library could be imported from is included: the
+    interpreter's site-packages, the per-user site-packages
+    (``pip install --user``), and everything else on sys.path (e.g.
+    PYTHONPATH entries).
+
+    Returns:
+        str: SHA-1 hex digest identifying this environment.
+    """
+    paths = sysconfig.get_paths()
+    dirs  = [paths["purelib"], paths["platlib"], site.getusersitepackages(),
+             *sys.path]
+
+    parts = [sys.executable, sys.version]
+    for d in dict.fromkeys(os.path.abspath(d) for d in dirs):
+        try:
+            parts.append(f"{d}={os.path.getmtime(d)}")
+        except OSError:
+            parts.append(f"{d}=missing")
+    raw = "|".join(parts)
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def load_cached_results(key: str):
+    """
+    Return cached check results for this environment, if any.
+
+    Args:
+        key (str): Value from environment_key().
+
+    Returns:
+        tuple | None: (python_ok, tf_ok, lib_results) on a cache hit,
+                      otherwise None.
+    """
+    try:
+        cached = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    try:
+        return cached["python_ok"], cached["tf_ok"], dict(cached["lib_results"])
+    except (KeyError, TypeError, ValueError):
+        # Written by an older version or hand-edited: treat as a miss
+        return None
+
+
+def save_cached_results(key: str, python_ok: bool, tf_ok: bool,
+                        lib_results: dict) -> None:
+    """
+    Atomically write check results to CACHE_FILE.
+
+    Failures to write (e.g. a read-only home directory) are ignored; the
+    cache is only an optimisation.
+
+    Args:
+        key         (str):  Value from environment_key().
+        python_ok   (bool): Python version check result.
+        tf_ok       (bool): TensorFlow check result.
+        lib_results (dict): Results from check_libraries().
+    """
+    payload = {"key": key, "python_ok": python_ok, "tf_ok": tf_ok,
+               "lib_results": lib_results}
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = CACHE_FILE.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp, CACHE_FILE)
+    except OSError:
+        pass
+
+
+# ── Section 5: Summary banner ─────────────────────────────────────────────────
 
 def print_summary(python_ok: bool, tf_ok: bool, lib_results: dict) -> None:
     """
@@ -191,10 +299,12 @@ def main() -> None:
 
     Control flow:
         1. Print header
-        2. Check Python version
-        3. Check TensorFlow
-        4. Check supporting libraries
-        5. Print summary / greeting
+        2. Reuse a cached successful result for this environment, or:
+           a. Check Python version
+           b. Check TensorFlow
+           c. Check supporting libraries
+           d. Cache the result if every check passed
+        3. Print summary / greeting
     """
     # Header
     print()
@@ -208,9 +318,21 @@ def main() -> None:
     print("Checking environment …")
     print()
 
-    python_ok   = check_python()
-    tf_ok       = check_tensorflow()
-    lib_results = check_libraries()
+    key    = environment_key()
+    cached = load_cached_results(key)
+
+    if cached is not None:
+        python_ok, tf_ok, lib_results = cached
+        info(f"Environment unchanged since last successful check ({CACHE_FILE})")
+    else:
+        python_ok   = check_python()
+        tf_ok       = check_tensorflow()
+        lib_results = check_libraries()
+
+        # Only a fully passing environment is cached, so missing packages
+        # are always listed on the next run
+        if python_ok and tf_ok and all(lib_results.values()):
+            save_cached_results(key, python_ok, tf_ok, lib_results)
 
     # Final summary
     print_summary(python_ok, tf_ok, lib_results)
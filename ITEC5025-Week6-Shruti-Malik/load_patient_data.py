@@ -22,7 +22,7 @@ Purpose:
         • Drop rows where the primary key (PatientID) is null or empty
         • Parse date columns into standard ISO-8601 format (YYYY-MM-DD HH:MM:SS)
         • Convert numeric columns to float; coerce invalid values to NaN
-        • Remove exact duplicate rows
+        • Remove duplicate rows (exact, or on a per-table key such as Labs')
         • Report row counts before and after cleaning
 
 How to run:
@@ -33,23 +33,35 @@ How to run:
     or in the same directory as this script.
 """
 
+from __future__ import annotations
+
 # ── Standard library imports ──────────────────────────────────────────────────
-import os           # File path operations
+import os           # File path operations, CPU count
 import sys          # Exit on fatal error
 
 # Force UTF-8 output on Windows so Unicode characters print correctly
 if sys.stdout.encoding and sys.stdout.encoding.lower() != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 import zipfile      # Read files directly from the zip archive
-import io           # Wrap zip byte-streams for pandas
+import io           # Buffer zip byte-streams for pyarrow
+import errno        # Report a full /dev/shm like the OS would
+import codecs       # Replace invalid UTF-8 on the fallback read path
+import csv          # Quoting constants for CSV output
+import importlib.util  # Probe for optional polars without importing it
 from pathlib import Path  # Cross-platform path handling
+from typing import TYPE_CHECKING, Callable  # Type hints
+from concurrent.futures import ProcessPoolExecutor, as_completed  # Parallel tables
+from multiprocessing import resource_tracker, shared_memory  # Hand tables to workers
 
 # ── Third-party imports ───────────────────────────────────────────────────────
-try:
+# pandas (with its pyarrow backend) is imported lazily (see main()) so that
+# early exits such as a missing zip file do not pay its import cost.
+# polars is optional: when installed and USE_POLARS is set, it replaces pandas
+# for the standard (non-streamed) tables.
+if TYPE_CHECKING:
     import pandas as pd
-except ImportError:
-    print("ERROR: pandas is not installed. Run:  pip install pandas")
-    sys.exit(1)
+    import polars as pl
+    import pyarrow as pa
 
 # ── ANSI colour helpers ───────────────────────────────────────────────────────
 GREEN  = "\033[92m"
@@ -58,6 +70,10 @@ YELLOW = "\033[93m"
 CYAN   = "\033[96m"
 RESET  = "\033[0m"
 
+# Plain output when redirected to a file/CI log, or when NO_COLOR is set
+if not sys.stdout.isatty() or "NO_COLOR" in os.environ:
+    GREEN = RED = YELLOW = CYAN = RESET = ""
+
 def ok(msg):   print(f"  {GREEN}[OK]  {msg}{RESET}")
 def fail(msg): print(f"  {RED}[ERR] {msg}{RESET}")
 def info(msg): print(f"  {CYAN}[i]   {msg}{RESET}")
@@ -78,7 +94,38 @@ ZIP_CANDIDATES = [
 # Output directory for cleaned CSVs
 DATA_DIR = SCRIPT_DIR / "data"
 
-# Table definitions: zip entry name → (output CSV name, date columns, numeric columns)
+# Labs file is very large (~4 GB uncompressed); stream it in Arrow blocks
+LARGE_FILES = {"LabsCorePopulatedTable.txt"}
+BLOCK_SIZE  = 8 << 20   # bytes per pyarrow.csv read block (8 MiB)
+
+# Read buffer placed in front of zip entries, so inflate runs on large reads
+READ_BUFFER_SIZE = 8 << 20   # 8 MiB
+
+# tmpfs backing POSIX shared memory on Linux; checked for free space before
+# a block is created (see shared_memory_has_room())
+SHM_DIR = "/dev/shm"
+
+# Field values read as null by every reader (pyarrow.csv's default list), so
+# the pyarrow and polars paths agree on missing values
+NULL_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "N/A", "NA", "NULL", "NaN", "n/a", "nan", "null",
+]
+
+# Values accepted as numbers by make_batch_cleaner(); anything else becomes null
+NUMERIC_PATTERN = r"^[+-]?(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?$"
+
+# Values accepted as timestamps by every cleaner: "YYYY-MM-DD HH:MM:SS" with
+# optional fractional seconds (dropped). Anything else, including a bare
+# date, becomes NaT/null -- as the original inferred-format parse did.
+DATETIME_PATTERN = r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(\.\d+)?$"
+DATETIME_FORMAT  = "%Y-%m-%d %H:%M:%S"
+
+# Upper bound on worker processes (one table per worker)
+MAX_WORKERS = 4
+
+# Table definitions: zip entry name → (output CSV name, date columns, numeric columns,
+# optional duplicate-detection key "dedup_subset"; default is the whole row)
 TABLES = {
     "PatientCorePopulatedTable.txt": {
         "output":   "patients_cleaned.csv",
@@ -124,6 +171,9 @@ TABLES = {
         "pk":       "PatientID",
         "dates":    ["LabDateTime"],
         "numerics": ["AdmissionID", "LabValue"],
+        # One result per patient/admission/test/timestamp; hashing these four
+        # columns is cheaper than comparing whole rows
+        "dedup_subset": ["PatientID", "AdmissionID", "LabName", "LabDateTime"],
         "rename":   {
             "PatientID":   "patient_id",
             "AdmissionID": "admission_id",
@@ -136,6 +186,15 @@ TABLES = {
 }
 
 
+# Columns of each table. arrow_csv_options() reads all of them as nullable
+# strings; numeric and date columns are converted later by the cleaners so
+# that invalid values are still coerced to NaN/NaT rather than failing the read.
+SCHEMA = {
+    entry_name: list(config["rename"])
+    for entry_name, config in TABLES.items()
+}
+
+
 # ── Core functions ────────────────────────────────────────────────────────────
 
 def find_zip() -> Path:
@@ -160,22 +219,161 @@ def find_zip() -> Path:
     )
 
 
-def read_table_from_zip(zf: zipfile.ZipFile, entry_name: str) -> pd.DataFrame:
+def shared_memory_has_room(size: int, held: int = 0) -> bool:
+    """
+    Tell whether a new shared-memory block of `size` bytes will fit.
+
+    On Linux a block is a file on the SHM_DIR tmpfs. Creating it only sets
+    its length, so a full tmpfs is not reported then: the first write to a
+    page that cannot be allocated raises SIGBUS and kills the process. The
+    free space is therefore checked up front, also reserving `held` bytes
+    for blocks still in use. Without SHM_DIR (Windows, macOS) creating the
+    block fails with OSError instead, and this check always passes.
+
+    Args:
+        size (int): Size of the block to create, in bytes.
+        held (int): Total size of blocks already created and not yet freed.
+
+    Returns:
+        bool: False if SHM_DIR does not have room for the block.
+    """
+    try:
+        st = os.statvfs(SHM_DIR)
+    except (AttributeError, OSError):
+        return True
+    return held + size <= st.f_bavail * st.f_frsize
+
+
+def copy_to_shared_memory(zf: zipfile.ZipFile, entry_name: str,
+                          held: int = 0) -> tuple:
     """
-    Read a tab-delimited text file from an open ZipFile into a DataFrame.
+    Decompress a zip entry into a new shared-memory block.
+
+    The caller owns the block and must close() and unlink() it once the
+    worker reading it has finished.
 
     Args:
         zf         (zipfile.ZipFile): Open zip archive.
         entry_name (str):             Name of the file inside the zip.
+        held       (int):             Bytes in blocks the caller still holds.
+
+    Returns:
+        tuple: (shared_memory.SharedMemory, number of bytes written)
+
+    Raises:
+        OSError: If there is no room for the block (ENOSPC).
+    """
+    size = zf.getinfo(entry_name).file_size
+    if not shared_memory_has_room(size, held):
+        raise OSError(errno.ENOSPC, f"not enough free space in {SHM_DIR}")
+    shm  = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    pos  = 0
+    try:
+        with zf.open(entry_name) as raw_file:
+            while chunk := raw_file.read(READ_BUFFER_SIZE):
+                shm.buf[pos:pos + len(chunk)] = chunk
+                pos += len(chunk)
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    return shm, pos
+
+
+def attach_shared_memory(name: str, size: int) -> tuple:
+    """
+    Attach to an existing shared-memory block and view its contents in
+    place, without copying them into the worker.
+
+    The caller must drop the buffer (and anything else still viewing it)
+    before calling close() on the block; it must not unlink() it, as the
+    parent owns it.
+
+    Args:
+        name (str): SharedMemory block name from copy_to_shared_memory().
+        size (int): Number of valid bytes in the block.
+
+    Returns:
+        tuple: (shared_memory.SharedMemory, pyarrow.Buffer over its first
+               `size` bytes)
+    """
+    import pyarrow as pa
+
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, pa.py_buffer(shm.buf)[:size]
+
+
+def arrow_csv_options(entry_name: str) -> dict:
+    """
+    Build the pyarrow.csv parse/convert options shared by both read paths.
+
+    Files are tab-delimited and every SCHEMA column is read as a nullable
+    string; numeric and date conversion happens during cleaning.
+
+    Args:
+        entry_name (str): Name of the file inside the zip (selects SCHEMA).
+
+    Returns:
+        dict: parse_options and convert_options keyword arguments.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    return {
+        "parse_options":   pacsv.ParseOptions(delimiter="\t"),
+        "convert_options": pacsv.ConvertOptions(
+            column_types={c: pa.string() for c in SCHEMA[entry_name]},
+            null_values=NULL_VALUES,
+            strings_can_be_null=True,
+        ),
+    }
+
+
+def is_invalid_utf8(exc: Exception) -> bool:
+    """
+    Tell whether a pyarrow.ArrowInvalid was raised for invalid UTF-8 data,
+    the only error the replace-and-retry fallbacks can recover from.
+
+    Args:
+        exc (Exception): Error raised by a pyarrow.csv reader.
+
+    Returns:
+        bool: True for "invalid UTF8 data" errors; False for anything else
+              (e.g. a row with the wrong number of columns).
+    """
+    return "invalid utf8" in str(exc).lower()
+
+
+def read_table(data: bytes | pa.Buffer, entry_name: str) -> pd.DataFrame:
+    """
+    Parse the raw bytes of a tab-delimited table into a DataFrame.
+
+    The bytes go straight to pyarrow's C++ reader, which decodes and
+    validates UTF-8 itself. Only if that validation fails is the data
+    decoded in Python with invalid bytes replaced (U+FFFD) and re-read.
+    The returned frame does not reference `data`.
+
+    Args:
+        data       (bytes | pa.Buffer): Contents of the file from the zip.
+        entry_name (str):   Name of the file inside the zip (selects SCHEMA).
 
     Returns:
         pd.DataFrame: Raw (uncleaned) data.
     """
-    with zf.open(entry_name) as raw_file:
-        # Wrap bytes in a text-mode stream so pandas can read it
-        text_stream = io.TextIOWrapper(raw_file, encoding="utf-8", errors="replace")
-        df = pd.read_csv(text_stream, sep="\t", low_memory=False)
-    return df
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    options = arrow_csv_options(entry_name)
+    try:
+        tbl = pacsv.read_csv(pa.BufferReader(data), **options)
+    except pa.ArrowInvalid as exc:
+        if not is_invalid_utf8(exc):
+            raise
+        data = bytes(data).decode("utf-8", errors="replace").encode("utf-8")
+        tbl = pacsv.read_csv(pa.BufferReader(data), **options)
+
+    return tbl.to_pandas(types_mapper={pa.string(): pd.StringDtype("pyarrow")}.get)
 
 
 def clean_table(df: pd.DataFrame, config: dict) -> pd.DataFrame:
@@ -183,11 +381,14 @@ def clean_table(df: pd.DataFrame, config: dict) -> pd.DataFrame:
     Apply standard cleaning steps to a raw DataFrame.
 
     Steps:
-        1. Strip whitespace from all object (string) columns.
+        1. Strip whitespace from string columns, except numeric columns
+           (to_numeric ignores surrounding spaces). Date columns are
+           stripped.
         2. Drop rows where the primary key is null or empty.
-        3. Parse date columns to datetime, then format as ISO strings.
+        3. Parse date columns to datetime (whole seconds); values not
+           matching DATETIME_PATTERN become NaT.
         4. Convert numeric columns to float (invalid → NaN).
-        5. Drop exact duplicate rows.
+        5. Drop duplicate rows (on config["dedup_subset"] if given).
 
     Args:
         df     (pd.DataFrame): Raw data.
@@ -196,63 +397,409 @@ def clean_table(df: pd.DataFrame, config: dict) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Cleaned data with renamed columns.
     """
-    raw_count = len(df)
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.compute as pc
 
-    # Step 1 – strip whitespace from string columns
-    str_cols = df.select_dtypes(include="object").columns
-    df[str_cols] = df[str_cols].apply(lambda col: col.str.strip())
+    raw_count = len(df)
 
-    # Step 2 – drop rows with null/empty primary key
+    # Step 1 – strip whitespace from string columns (one Arrow kernel call
+    # per column instead of a Python-level apply). Numeric columns are
+    # skipped: to_numeric below ignores surrounding spaces.
+    skip     = set(config.get("numerics", []))
+    str_cols = [c for c in df.select_dtypes(include=["object", "string"]).columns
+                if c not in skip]
+    for col in str_cols:
+        trimmed = pc.utf8_trim_whitespace(pa.array(df[col]))
+        df[col] = pd.Series(trimmed, index=df.index, dtype=df[col].dtype)
+
+    # Step 2 – drop rows with null/empty primary key (a single length test:
+    # null lengths count as empty)
     pk = config["pk"]
     if pk in df.columns:
-        df = df[df[pk].notna() & (df[pk] != "")]
+        df = df[df[pk].str.len().gt(0).fillna(False)]
 
-    # Step 3 – parse and reformat date columns
+    # Step 3 – parse date columns matching DATETIME_PATTERN, truncated to
+    # whole seconds; to_csv then writes them without a per-row strftime
     for col in config.get("dates", []):
         if col in df.columns:
-            df[col] = pd.to_datetime(df[col], errors="coerce") \
-                        .dt.strftime("%Y-%m-%d %H:%M:%S")
+            valid = df[col].str.fullmatch(DATETIME_PATTERN).fillna(False)
+            df[col] = pd.to_datetime(
+                df[col].str.slice(0, 19).where(valid),
+                format=DATETIME_FORMAT, errors="coerce", cache=True
+            )
 
-    # Step 4 – coerce numeric columns
-    for col in config.get("numerics", []):
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+    # Step 4 – coerce numeric columns in a single sub-frame assignment
+    num_cols = [c for c in config.get("numerics", []) if c in df.columns]
+    if num_cols:
+        df[num_cols] = df[num_cols].apply(pd.to_numeric, errors="coerce")
 
-    # Step 5 – drop exact duplicates
-    df = df.drop_duplicates()
+    # Step 5 – drop duplicates (whole row unless a key subset is configured)
+    df = df.drop_duplicates(subset=config.get("dedup_subset"))
 
     # Rename columns to snake_case
-    df = df.rename(columns=config.get("rename", {}))
+    df.rename(columns=config.get("rename", {}), inplace=True)
 
     clean_count = len(df)
     dropped     = raw_count - clean_count
     return df, raw_count, clean_count, dropped
 
 
+def make_batch_cleaner(config: dict, schema: pa.Schema) -> Callable:
+    """
+    Build a cleaner that applies the clean_table() steps to Arrow batches.
+
+    Used for the streamed large-file path so that data never leaves Arrow:
+    every step is a pyarrow.compute kernel. The config lookups, column
+    membership checks and field-index resolution are done once here for
+    the table's schema, not again for every batch.
+
+    Steps performed by the returned function:
+        1. Strip whitespace from all string columns.
+        2. Drop rows where the primary key is null or empty.
+        3. Parse date columns to second-resolution timestamps.
+        4. Convert numeric columns to float (invalid → null).
+        5. Drop duplicate rows (on config["dedup_subset"] if given;
+           first occurrence kept).
+
+    Args:
+        config (dict):      Table config from TABLES dict.
+        schema (pa.Schema): Schema of the raw batches (all columns strings).
+
+    Returns:
+        Callable: clean(batch: pa.RecordBatch) -> pa.Table, returning the
+                  cleaned data with renamed columns.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    names     = schema.names
+    str_idx   = [i for i, f in enumerate(schema)
+                 if pa.types.is_string(f.type) or pa.types.is_large_string(f.type)]
+    pk        = config["pk"] if config["pk"] in names else None
+    date_idx  = [names.index(c) for c in config.get("dates", []) if c in names]
+    num_idx   = [names.index(c) for c in config.get("numerics", []) if c in names]
+    keys      = config.get("dedup_subset") or names
+    rename    = config.get("rename", {})
+    new_names = [rename.get(c, c) for c in names]
+
+    def clean(batch: pa.RecordBatch) -> pa.Table:
+        tbl = pa.Table.from_batches([batch])
+
+        # Step 1 – strip whitespace from string columns
+        for i in str_idx:
+            tbl = tbl.set_column(i, names[i], pc.utf8_trim_whitespace(tbl.column(i)))
+
+        # Step 2 – drop rows with null/empty primary key (null lengths are
+        # dropped by filter)
+        if pk is not None:
+            tbl = tbl.filter(pc.greater(pc.utf8_length(tbl[pk]), 0))
+
+        # Step 3 – parse date columns matching DATETIME_PATTERN (fractional
+        # seconds are dropped, as in clean_table)
+        for i in date_idx:
+            col    = tbl.column(i)
+            valid  = pc.match_substring_regex(col, DATETIME_PATTERN)
+            parsed = pc.strptime(
+                pc.utf8_slice_codeunits(pc.if_else(valid, col, None), 0, 19),
+                format=DATETIME_FORMAT, unit="s", error_is_null=True
+            )
+            tbl = tbl.set_column(i, names[i], parsed)
+
+        # Step 4 – coerce numeric columns
+        for i in num_idx:
+            col    = tbl.column(i)
+            valid  = pc.match_substring_regex(col, NUMERIC_PATTERN)
+            values = pc.cast(pc.if_else(valid, col, None), pa.float64())
+            tbl = tbl.set_column(i, names[i], values)
+
+        # Step 5 – drop duplicates, keeping the first occurrence in order
+        first_rows = (
+            tbl.append_column("__row", pa.array(range(len(tbl)), pa.int64()))
+               .group_by(keys, use_threads=False)
+               .aggregate([("__row", "min")])["__row_min"]
+        )
+        tbl = tbl.take(pc.take(first_rows, pc.sort_indices(first_rows)))
+
+        # Rename columns to snake_case
+        return tbl.rename_columns(new_names)
+
+    return clean
+
+
+def read_table_polars(data: bytes | pa.Buffer) -> pl.DataFrame:
+    """
+    Parse the raw bytes of a tab-delimited table into a polars DataFrame,
+    with every column as a string and NULL_VALUES read as null.
+
+    Args:
+        data (bytes | pa.Buffer): Contents of the file from the zip.
+
+    Returns:
+        pl.DataFrame: Raw (uncleaned) data.
+    """
+    import polars as pl
+    import pyarrow as pa
+
+    return pl.read_csv(
+        pa.BufferReader(data), separator="\t", infer_schema=False,
+        null_values=NULL_VALUES, encoding="utf8-lossy"
+    )
+
+
+def clean_table_polars(df: pl.DataFrame, config: dict) -> tuple:
+    """
+    Apply the clean_table() steps to a polars DataFrame as a single lazy
+    query, so polars can fuse and parallelise them.
+
+    Args:
+        df     (pl.DataFrame): Raw data (all columns strings).
+        config (dict):         Table config from TABLES dict.
+
+    Returns:
+        tuple: (cleaned pl.DataFrame, raw_count, clean_count, dropped)
+    """
+    import polars as pl
+
+    raw_count = df.height
+    cols      = df.columns
+    pk        = config["pk"]
+
+    # pandas.to_numeric keeps a column as integers when every value it can
+    # parse is an integer (invalid values just become null); do the same so
+    # that IDs are written as "1" rather than "1.0"
+    numeric_types = {}
+    for col in config.get("numerics", []):
+        if col in cols:
+            stripped = df[col].str.strip_chars()
+            n_int    = stripped.cast(pl.Int64, strict=False).null_count()
+            n_float  = stripped.cast(pl.Float64, strict=False).null_count()
+            numeric_types[col] = pl.Int64 if n_int == n_float else pl.Float64
+
+    # Step 1 – strip whitespace from string columns
+    lf = df.lazy().with_columns(pl.col(pl.String).str.strip_chars())
+
+    # Step 2 – drop rows with null/empty primary key
+    if pk in cols:
+        lf = lf.filter(pl.col(pk).str.len_bytes() > 0)
+
+    # Step 3 – parse date columns matching DATETIME_PATTERN, truncated to
+    # whole seconds
+    lf = lf.with_columns(
+        pl.when(pl.col(col).str.contains(DATETIME_PATTERN))
+          .then(pl.col(col).str.slice(0, 19))
+          .str.strptime(pl.Datetime("us"), DATETIME_FORMAT, strict=False)
+          .alias(col)
+        for col in config.get("dates", []) if col in cols
+    )
+
+    # Step 4 – coerce numeric columns (invalid → null)
+    lf = lf.with_columns(
+        pl.col(col).cast(dtype, strict=False) for col, dtype in numeric_types.items()
+    )
+
+    # Step 5 – drop duplicates (whole row unless a key subset is configured)
+    lf = lf.unique(subset=config.get("dedup_subset"), keep="first",
+                   maintain_order=True)
+
+    # Rename columns to snake_case
+    lf = lf.rename({k: v for k, v in config.get("rename", {}).items() if k in cols})
+
+    df = lf.collect()
+    return df, raw_count, df.height, raw_count - df.height
+
+
 def save_csv(df: pd.DataFrame, output_path: Path) -> None:
     """
     Save a DataFrame to a UTF-8 CSV file (no index column).
 
+    Datetime columns are written as "YYYY-MM-DD HH:MM:SS" even when every
+    value falls on midnight (pandas would otherwise drop the time part).
+    Lines end in "\n" on every platform, matching the pyarrow and polars
+    writers, and only fields that need it are quoted.
+
     Args:
         df          (pd.DataFrame): Data to save.
         output_path (Path):         Destination file path.
     """
-    df.to_csv(output_path, index=False, encoding="utf-8")
+    df.to_csv(output_path, index=False, encoding="utf-8",
+              date_format=DATETIME_FORMAT,
+              lineterminator="\n", quoting=csv.QUOTE_MINIMAL)
 
 
-def print_summary(df: pd.DataFrame, table_name: str) -> None:
+def print_summary(preview: pd.DataFrame, shape: tuple, table_name: str) -> None:
     """
     Print a brief statistical summary of a cleaned DataFrame.
 
     Args:
-        df         (pd.DataFrame): Cleaned data.
+        preview    (pd.DataFrame): First few rows of the cleaned data.
+        shape      (tuple):        (rows, columns) of the full cleaned data.
         table_name (str):          Human-readable table name.
     """
     print(f"\n  {CYAN}── {table_name} preview ──{RESET}")
-    print(df.head(3).to_string(index=False))
+    print(preview.to_string(index=False))
     print()
-    info(f"Columns : {list(df.columns)}")
-    info(f"Shape   : {df.shape[0]:,} rows × {df.shape[1]} columns")
+    info(f"Columns : {list(preview.columns)}")
+    info(f"Shape   : {shape[0]:,} rows × {shape[1]} columns")
+
+
+def stream_large_table(zip_path: Path, entry_name: str, config: dict,
+                       out_path: Path, replace_invalid: bool = False) -> tuple:
+    """
+    Stream a large table from the zip through make_batch_cleaner() into a
+    CSV file, one Arrow block at a time.
+
+    By default the zip's byte stream goes straight to pyarrow.csv, which
+    decodes and validates UTF-8 in C++. With replace_invalid=True the
+    stream is first re-encoded in Python with invalid bytes replaced
+    (U+FFFD); this slower path is only used after a validation failure.
+
+    Args:
+        zip_path        (Path): Path to 100000-Patients.zip.
+        entry_name      (str):  Name of the file inside the zip.
+        config          (dict): Table config from TABLES dict.
+        out_path        (Path): Destination CSV (overwritten).
+        replace_invalid (bool): Replace invalid UTF-8 instead of failing.
+
+    Returns:
+        tuple: (raw_count, clean_count)
+
+    Raises:
+        pyarrow.ArrowInvalid: On invalid UTF-8 when replace_invalid is False.
+    """
+    import pyarrow.csv as pacsv
+
+    raw_n    = 0
+    clean_n  = 0
+    writer   = None
+
+    with zipfile.ZipFile(zip_path, "r") as zf, \
+         io.BufferedReader(zf.open(entry_name),
+                           buffer_size=READ_BUFFER_SIZE) as raw_file:
+        source = raw_file
+        if replace_invalid:
+            source = codecs.EncodedFile(raw_file, "utf-8", "utf-8", errors="replace")
+
+        reader = pacsv.open_csv(
+            source,
+            read_options=pacsv.ReadOptions(block_size=BLOCK_SIZE),
+            **arrow_csv_options(entry_name),
+        )
+        clean = make_batch_cleaner(config, reader.schema)
+        try:
+            for batch_num, batch in enumerate(reader, 1):
+                raw_n += batch.num_rows
+                tbl = clean(batch)
+                clean_n += tbl.num_rows
+
+                # Header is written once, when the writer is created
+                if writer is None:
+                    writer = pacsv.CSVWriter(str(out_path), tbl.schema)
+                writer.write_table(tbl)
+
+                if batch_num % 10 == 0:
+                    info(f"  {entry_name}: processed {raw_n:,} rows so far ...")
+        finally:
+            if writer is not None:
+                writer.close()
+
+    return raw_n, clean_n
+
+
+def process_table(zip_path: Path, entry_name: str, config: dict,
+                  data_dir: Path, use_polars: bool = False,
+                  shm_name: str | None = None, shm_size: int = 0) -> dict:
+    """
+    Read, clean, and save a single table from the zip archive.
+
+    Runs inside a worker process and returns only small, picklable results
+    to the parent. Standard tables are normally decompressed once by the
+    parent and passed in through shared memory (shm_name/shm_size); large
+    files, or calls without a block, are read from the zip directly.
+
+    Args:
+        zip_path   (Path): Path to 100000-Patients.zip.
+        entry_name (str):  Name of the file inside the zip.
+        config     (dict): Table config from TABLES dict.
+        data_dir   (Path): Output directory for the cleaned CSV.
+        use_polars (bool): Clean standard tables with polars instead of
+                           pandas (the streamed path always uses pyarrow).
+                           Tables polars cannot parse fall back to pandas.
+        shm_name   (str):  Shared-memory block holding the file, if any.
+        shm_size   (int):  Number of valid bytes in that block.
+
+    Returns:
+        dict: raw/clean/dropped row counts, output path, and (for
+              non-streamed tables) a preview and shape for print_summary().
+    """
+    out_path = data_dir / config["output"]
+    result = {"preview": None, "shape": None}
+
+    if entry_name in LARGE_FILES:
+        # ── Streamed path for very large files ───────────────────────────────
+        import pyarrow as pa
+
+        try:
+            raw_n, clean_n = stream_large_table(zip_path, entry_name, config, out_path)
+        except pa.ArrowInvalid as exc:
+            if not is_invalid_utf8(exc):
+                raise
+            # Invalid UTF-8 in the file: start again, replacing bad bytes
+            info(f"  {entry_name}: invalid UTF-8 found -- re-reading with replacement")
+            raw_n, clean_n = stream_large_table(zip_path, entry_name, config,
+                                                out_path, replace_invalid=True)
+
+    else:
+        # ── Standard path for normal-sized files ─────────────────────────────
+        shm = None
+        if shm_name is not None:
+            # Parse straight from the parent's block instead of copying it
+            shm, data = attach_shared_memory(shm_name, shm_size)
+        else:
+            with zipfile.ZipFile(zip_path, "r") as zf:
+                data = zf.read(entry_name)
+
+        try:
+            if use_polars:
+                import polars as pl
+
+                try:
+                    df_raw = read_table_polars(data)
+                except pl.exceptions.PolarsError as exc:
+                    # polars' CSV parser is stricter than pyarrow's (e.g. a stray
+                    # quote inside a field); clean this table with pandas instead
+                    info(f"  {entry_name}: polars could not parse it ({exc.__class__.__name__})"
+                         " -- falling back to pandas")
+                    use_polars = False
+
+            if not use_polars:
+                df_raw = read_table(data, entry_name)
+        finally:
+            # The parsed frame owns its memory, so the block can be detached
+            # as soon as parsing is done
+            del data
+            if shm is not None:
+                try:
+                    shm.close()
+                except BufferError:
+                    # A pending parse error's traceback still views the
+                    # block; it is unmapped once that is discarded
+                    pass
+
+        if use_polars:
+            df_clean, raw_n, clean_n, _ = clean_table_polars(df_raw, config)
+            df_clean.write_csv(out_path, datetime_format=DATETIME_FORMAT)
+            result["preview"] = df_clean.head(3).to_pandas()
+        else:
+            df_clean, raw_n, clean_n, _ = clean_table(df_raw, config)
+            save_csv(df_clean, out_path)
+            result["preview"] = df_clean.head(3)
+
+        result["shape"] = df_clean.shape
+
+    result.update(raw=raw_n, clean=clean_n, dropped=raw_n - clean_n,
+                  output=out_path)
+    return result
 
 
 # ── Main orchestration ────────────────────────────────────────────────────────
@@ -261,11 +808,13 @@ def main() -> None:
     """
     Orchestrate the full extract → clean → save pipeline.
 
-    For each table in TABLES:
-        1. Read from zip
+    Each table in TABLES is handed to a worker process (process_table),
+    which will:
+        1. Read from zip (standard tables arrive via shared memory,
+           already decompressed by the parent)
         2. Clean
         3. Save to data/
-        4. Print summary
+    The parent then prints a summary for each table as it completes.
     """
     print()
     print(f"{CYAN}{'=' * 60}")
@@ -282,6 +831,22 @@ def main() -> None:
         fail(str(exc))
         sys.exit(1)
 
+    # ── Import pandas only once there is work to do ───────────────────────────
+    try:
+        import pandas as pd                              # noqa: F401
+        import pyarrow                                   # noqa: F401
+    except ImportError:
+        fail("pandas and pyarrow are required. Run:  pip install pandas pyarrow")
+        sys.exit(1)
+
+    # polars is opt-in (set USE_POLARS); pandas/pyarrow remain the default
+    use_polars = "USE_POLARS" in os.environ
+    if use_polars and importlib.util.find_spec("polars") is None:
+        warn("USE_POLARS is set but polars is not installed -- using pandas")
+        use_polars = False
+    elif use_polars:
+        info("USE_POLARS set -- using polars for the standard tables")
+
     # ── Ensure output directory exists ────────────────────────────────────────
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     ok(f"Output directory: {DATA_DIR}")
@@ -290,74 +855,100 @@ def main() -> None:
     # ── Process each table ────────────────────────────────────────────────────
     results = []
 
-    # Labs file is very large (~4 GB uncompressed); read it in chunks
-    LARGE_FILES = {"LabsCorePopulatedTable.txt"}
-    CHUNK_SIZE  = 100_000   # rows per chunk
+    # Standard tables are decompressed once here into shared memory; their
+    # blocks are released as soon as the worker reading them finishes
+    shared = {}
 
     with zipfile.ZipFile(zip_path, "r") as zf:
-        available = {e.filename for e in zf.infolist()}
-
-        for entry_name, config in TABLES.items():
-            print(f"Processing  {CYAN}{entry_name}{RESET} ...")
-
-            if entry_name not in available:
+        # zipfile already indexes its central directory by name in NameToInfo
+        pending = []
+        for entry_name in TABLES:
+            if entry_name not in zf.NameToInfo:
                 warn(f"  {entry_name} not found in zip -- skipping.")
                 continue
-
-            try:
-                out_path = DATA_DIR / config["output"]
-
-                if entry_name in LARGE_FILES:
-                    # ── Chunked path for very large files ────────────────────
-                    info(f"Large file detected -- reading in chunks of {CHUNK_SIZE:,} rows")
-                    raw_n    = 0
-                    clean_n  = 0
-                    first    = True
-
-                    with zf.open(entry_name) as raw_file:
-                        text_stream = io.TextIOWrapper(raw_file, encoding="utf-8", errors="replace")
-                        reader = pd.read_csv(
-                            text_stream, sep="\t", low_memory=False,
-                            chunksize=CHUNK_SIZE
-                        )
-                        for chunk_num, chunk in enumerate(reader, 1):
-                            raw_n += len(chunk)
-                            chunk_clean, _, c_clean, _ = clean_table(chunk, config)
-                            clean_n += c_clean
-
-                            # Write header only on first chunk
-                            chunk_clean.to_csv(
-                                out_path, mode="a" if not first else "w",
-                                index=False, encoding="utf-8",
-                                header=first
-                            )
-                            first = False
-
-                            if chunk_num % 10 == 0:
-                                info(f"  Processed {raw_n:,} rows so far ...")
-
-                    ok(f"Cleaned -- {clean_n:,} rows retained")
-                    ok(f"Saved -- {out_path.name}")
-
-                else:
-                    # ── Standard path for normal-sized files ─────────────────
-                    df_raw = read_table_from_zip(zf, entry_name)
-                    info(f"Read {len(df_raw):,} raw rows")
-
-                    df_clean, raw_n, clean_n, dropped = clean_table(df_raw, config)
-                    if dropped > 0:
-                        warn(f"Dropped {dropped:,} rows (duplicates / null PKs)")
-                    ok(f"Cleaned -- {clean_n:,} rows retained")
-
-                    save_csv(df_clean, out_path)
-                    ok(f"Saved -- {out_path.name}")
-
-                    print_summary(df_clean, config["output"])
-
-                results.append((entry_name, raw_n, clean_n, str(out_path)))
-
-            except Exception as exc:
-                fail(f"Error processing {entry_name}: {exc}")
+            pending.append(entry_name)
+
+        # Large files stream straight from the zip in their worker, so submit
+        # them first; they run while the standard tables are being copied
+        pending.sort(key=lambda name: name not in LARGE_FILES)
+
+        # Tables are independent, so each one runs in its own worker process
+        workers = max(1, min(MAX_WORKERS, len(pending), os.cpu_count() or 1))
+
+        # Start the shared-memory resource tracker before any worker exists,
+        # so forked workers share it instead of starting their own (which
+        # would report the parent's blocks as leaked when the worker exits)
+        if os.name == "posix":
+            resource_tracker.ensure_running()
+
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {}
+                for entry_name in pending:
+                    print(f"Processing  {CYAN}{entry_name}{RESET} ...")
+                    if entry_name in LARGE_FILES:
+                        info(f"Large file detected -- streaming in {BLOCK_SIZE >> 20} MiB blocks")
+                        shm_args = ()
+                    else:
+                        try:
+                            held      = sum(b.size for b in shared.values())
+                            shm, size = copy_to_shared_memory(zf, entry_name, held)
+                        except OSError as exc:
+                            # No room for a shared block (e.g. /dev/shm full):
+                            # the worker reads the entry from the zip itself
+                            info(f"Shared memory unavailable ({exc}) -- worker will read the zip")
+                            shm_args = ()
+                        except Exception as exc:
+                            # Corrupt entry (bad CRC, truncated data): skip it
+                            # and carry on with the other tables
+                            fail(f"Error processing {entry_name}: {exc}")
+                            print()
+                            continue
+                        else:
+                            shared[entry_name] = shm
+                            shm_args = (shm.name, size)
+                    future = pool.submit(process_table, zip_path, entry_name,
+                                         TABLES[entry_name], DATA_DIR, use_polars,
+                                         *shm_args)
+                    futures[future] = entry_name
+                print()
+
+                for future in as_completed(futures):
+                    entry_name = futures[future]
+                    config     = TABLES[entry_name]
+                    print(f"Finished    {CYAN}{entry_name}{RESET}")
+
+                    shm = shared.pop(entry_name, None)
+                    if shm is not None:
+                        shm.close()
+                        shm.unlink()
+
+                    try:
+                        res = future.result()
+                    except Exception as exc:
+                        fail(f"Error processing {entry_name}: {exc}")
+                        continue
+
+                    if entry_name not in LARGE_FILES:
+                        info(f"Read {res['raw']:,} raw rows")
+                        if res["dropped"] > 0:
+                            warn(f"Dropped {res['dropped']:,} rows (duplicates / null PKs)")
+                    ok(f"Cleaned -- {res['clean']:,} rows retained")
+                    ok(f"Saved -- {res['output'].name}")
+
+                    if res["preview"] is not None:
+                        print_summary(res["preview"], res["shape"], config["output"])
+                    print()
+
+                    results.append((entry_name, res["raw"], res["clean"], str(res["output"])))
+        finally:
+            for shm in shared.values():
+                shm.close()
+                shm.unlink()
+
+    # Report in TABLES order regardless of completion order
+    order = list(TABLES)
+    results.sort(key=lambda r: order.index(r[0]))
 
     # ── Final report ──────────────────────────────────────────────────────────
     print(f"{CYAN}{'=' * 60}")